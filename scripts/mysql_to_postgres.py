@@ -3,140 +3,252 @@
 Convert MySQL schema to PostgreSQL
 """
 
+import argparse
+import io
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+_RE_CREATE = re.compile(r'CREATE TABLE `?(\w+)`?')
+_RE_COL = re.compile(r'^\w+\s+')
+_RE_LEN = re.compile(r'\(\d+\)')
+
+_AUTO_INCREMENT = 'NOT NULL AUTO_INCREMENT'
+
+# Deletion table for MySQL identifier quoting
+_STRIP_BACKTICK = str.maketrans('', '', '`')
+
+# MySQL column types and their PostgreSQL equivalents, matched in one pass
+_TYPE_RE = re.compile(
+    r'\b(bigint|smallint|tinyint|int)\(\d+\)'
+    r'|\b(datetime|longtext|mediumtext|longblob|mediumblob|blob|text)\b'
+)
+_TYPE_MAP = {
+    'bigint': 'BIGINT',
+    'smallint': 'SMALLINT',
+    'tinyint': 'SMALLINT',
+    'int': 'INTEGER',
+    'datetime': 'TIMESTAMP',
+    'longtext': 'TEXT',
+    'mediumtext': 'TEXT',
+    'text': 'TEXT',
+    'longblob': 'BYTEA',
+    'mediumblob': 'BYTEA',
+    'blob': 'BYTEA',
+}
+
+def _convert_type(match):
+    return _TYPE_MAP[match.group(1) or match.group(2)]
+
+class _Table:
+    """Buffered state for the CREATE TABLE block being converted"""
+
+    def __init__(self, name):
+        self.name = name
+        self.columns = []
+        self.constraints = []
+        self.indexes = []
+        # Set once an AUTO_INCREMENT column has become the SERIAL primary key
+        self.has_serial_pk = False
+
+def _serial_column(col_line):
+    """Rewrite 'int(N) NOT NULL AUTO_INCREMENT' as a SERIAL primary key
+
+    Returns None when the column does not have that shape.
+    """
+    lower = col_line.lower()
+    if 'bigint' in lower:
+        type_prefix, serial = 'bigint(', 'BIGSERIAL'
+    elif 'smallint' in lower:
+        type_prefix, serial = 'smallint(', 'SMALLSERIAL'
+    else:
+        type_prefix, serial = 'int(', 'SERIAL'
+
+    start = col_line.find(type_prefix)
+    if start < 0:
+        return None
+    end = col_line.find(')', start)
+    if end < 0 or not col_line[start + len(type_prefix):end].isdigit():
+        return None
+
+    rest = col_line[end + 1:]
+    tail = rest.lstrip()
+    if len(tail) == len(rest) or not tail.startswith(_AUTO_INCREMENT):
+        return None
+    return f'{col_line[:start]}{serial} PRIMARY KEY{tail[len(_AUTO_INCREMENT):]}'
+
+def _handle_column(table, line):
+    """Column definition"""
+    if not _RE_COL.match(line):
+        return
+
+    col_line = line.rstrip(',')
+
+    # Handle AUTO_INCREMENT
+    if 'AUTO_INCREMENT' in col_line:
+        serial_line = _serial_column(col_line)
+        if serial_line is not None:
+            col_line = serial_line
+            table.has_serial_pk = True
+
+    # Convert data types
+    col_line = _TYPE_RE.sub(_convert_type, col_line)
+
+    table.columns.append(col_line)
+
+def _split_key(line):
+    """Split 'KEY name (cols)' into (name, cols), or None if malformed"""
+    head, sep, rest = line.partition('(')
+    words = head.split()
+    if not sep or ')' not in rest or len(words) < 2:
+        return None
+    return words[-1], rest.rsplit(')', 1)[0]
+
+def _handle_primary_key(table, line):
+    """PRIMARY KEY"""
+    if not line.startswith('PRIMARY KEY'):
+        return
+    # Already handled in column if AUTO_INCREMENT
+    if not table.has_serial_pk:
+        key = _split_key(line)
+        if key:
+            table.constraints.append(f'PRIMARY KEY ({key[1]})')
+
+def _handle_unique_key(table, line):
+    """UNIQUE KEY"""
+    key = _split_key(line)
+    if key:
+        table.constraints.append(f'UNIQUE ({key[1]})')
+
+def _handle_key(table, line):
+    """Regular KEY (index)"""
+    key = _split_key(line)
+    if key:
+        idx_name, idx_cols = key
+        # Remove MySQL-specific length specifications in indexes
+        idx_cols = _RE_LEN.sub('', idx_cols)
+        # Skip FK indexes, they're implied
+        if not idx_name.startswith('FK_'):
+            table.indexes.append(f'CREATE INDEX {idx_name} ON {table.name} ({idx_cols});')
+
+def _skip(table, line):
+    """CONSTRAINT (foreign keys) - skip for baseline, add separately if needed"""
+
+# Handlers for in-table lines keyed by their first token; anything else is
+# treated as a column definition
+_PREFIX_DISPATCH = {
+    'PRIMARY': _handle_primary_key,
+    'UNIQUE': _handle_unique_key,
+    'KEY': _handle_key,
+    'CONSTRAINT': _skip,
+}
+
+def iter_table_blocks(lines):
+    """Yield the stripped lines of each CREATE TABLE ... ) ENGINE= block
+
+    Lines outside a CREATE TABLE statement are dropped.
+    """
+
+    block = None
 
-def convert_mysql_to_postgres(mysql_sql):
-    """Convert MySQL CREATE TABLE statements to PostgreSQL"""
-    
-    lines = mysql_sql.split('\n')
-    output = []
-    in_table = False
-    columns = []
-    constraints = []
-    indexes = []
-    
     for line in lines:
         line = line.strip()
-        
+
         # Start of CREATE TABLE
         if line.startswith('CREATE TABLE'):
-            in_table = True
-            table_name = re.search(r'CREATE TABLE `?(\w+)`?', line).group(1)
-            output.append(f'CREATE TABLE {table_name} (')
-            columns = []
-            constraints = []
-            indexes = []
+            block = [line]
             continue
-            
-        # End of CREATE TABLE
-        if in_table and line.startswith(') ENGINE='):
-            # Add columns
-            all_items = columns + [c for c in constraints if not c.startswith('CONSTRAINT FK_')]
-            
-            for i, item in enumerate(all_items):
-                if i < len(all_items) - 1:
-                    output.append(f'  {item},')
-                else:
-                    output.append(f'  {item}')
-            
-            output.append(');')
-            output.append('')
-            
-            # Add indexes after table
-            for idx in indexes:
-                if not idx.startswith('-- FK index'):
-                    output.append(idx)
-            
-            in_table = False
+
+        if block is None:
             continue
-            
-        # Process columns and constraints
-        if in_table:
-            # Remove backticks
-            line = line.replace('`', '')
-            
-            # Column definition
-            if re.match(r'^\w+\s+', line) and not line.startswith('PRIMARY') and not line.startswith('KEY') and not line.startswith('UNIQUE') and not line.startswith('CONSTRAINT'):
-                # Convert data types
-                col_line = line.rstrip(',')
-                
-                # Handle AUTO_INCREMENT
-                if 'AUTO_INCREMENT' in col_line:
-                    if 'bigint' in col_line.lower():
-                        col_line = re.sub(r'bigint\(\d+\)\s+NOT NULL AUTO_INCREMENT', 'BIGSERIAL PRIMARY KEY', col_line)
-                    elif 'smallint' in col_line.lower():
-                        col_line = re.sub(r'smallint\(\d+\)\s+NOT NULL AUTO_INCREMENT', 'SMALLSERIAL PRIMARY KEY', col_line)
-                    else:
-                        col_line = re.sub(r'int\(\d+\)\s+NOT NULL AUTO_INCREMENT', 'SERIAL PRIMARY KEY', col_line)
-                else:
-                    # Convert integer types
-                    col_line = re.sub(r'int\(\d+\)', 'INTEGER', col_line)
-                    col_line = re.sub(r'bigint\(\d+\)', 'BIGINT', col_line)
-                    col_line = re.sub(r'smallint\(\d+\)', 'SMALLINT', col_line)
-                    col_line = re.sub(r'tinyint\(\d+\)', 'SMALLINT', col_line)
-                    
-                # Convert other types
-                col_line = col_line.replace('datetime', 'TIMESTAMP')
-                col_line = col_line.replace('longtext', 'TEXT')
-                col_line = col_line.replace('mediumtext', 'TEXT')
-                col_line = col_line.replace('longblob', 'BYTEA')
-                col_line = col_line.replace('mediumblob', 'BYTEA')
-                col_line = col_line.replace('blob', 'BYTEA')
-                
-                # Fix capitalization issues
-                col_line = col_line.replace('smallINTEGER', 'SMALLINT')
-                col_line = col_line.replace('bigINTEGER', 'BIGINT')
-                col_line = col_line.replace('smallSERIAL', 'SMALLSERIAL')
-                
-                # Handle text type with no size
-                col_line = re.sub(r'\btext\b', 'TEXT', col_line)
-                
-                columns.append(col_line)
-                
-            # PRIMARY KEY
-            elif line.startswith('PRIMARY KEY'):
-                # Already handled in column if AUTO_INCREMENT
-                if not any('SERIAL' in col for col in columns):
-                    pk_col = re.search(r'PRIMARY KEY \(([^)]+)\)', line).group(1)
-                    constraints.append(f'PRIMARY KEY ({pk_col})')
-                    
-            # UNIQUE KEY
-            elif line.startswith('UNIQUE KEY'):
-                match = re.search(r'UNIQUE KEY (\w+) \(([^)]+)\)', line)
-                if match:
-                    idx_name = match.group(1)
-                    idx_cols = match.group(2)
-                    constraints.append(f'UNIQUE ({idx_cols})')
-                    
-            # Regular KEY (index)
-            elif line.startswith('KEY'):
-                match = re.search(r'KEY (\w+) \(([^)]+)\)', line)
-                if match:
-                    idx_name = match.group(1)
-                    idx_cols = match.group(2)
-                    # Remove MySQL-specific length specifications in indexes
-                    idx_cols = re.sub(r'\(\d+\)', '', idx_cols)
-                    # Skip FK indexes, they're implied
-                    if not idx_name.startswith('FK_'):
-                        indexes.append(f'CREATE INDEX {idx_name} ON {table_name} ({idx_cols});')
-                        
-            # CONSTRAINT (foreign keys) - skip for baseline, add separately if needed
-            elif line.startswith('CONSTRAINT'):
-                pass
-    
-    return '\n'.join(output)
+
+        block.append(line)
+
+        # End of CREATE TABLE
+        if line.startswith(') ENGINE='):
+            yield block
+            block = None
+
+def _convert_one_table(block):
+    """Convert one CREATE TABLE block from iter_table_blocks to PostgreSQL"""
+
+    table = _Table(_RE_CREATE.search(block[0]).group(1))
+
+    # Process columns and constraints, with backticks removed. This is the
+    # per-line hot loop, so the lookups it repeats are bound to locals.
+    dispatch = _PREFIX_DISPATCH.get
+    handle_column = _handle_column
+    strip_backtick = _STRIP_BACKTICK
+    for line in block[1:-1]:
+        first = line.split(None, 1)[0] if line else ''
+        dispatch(first, handle_column)(table, line.translate(strip_backtick))
+
+    out = io.StringIO()
+    out.write(f'CREATE TABLE {table.name} (\n')
+
+    # Add columns
+    all_items = table.columns + [c for c in table.constraints if not c.startswith('CONSTRAINT FK_')]
+
+    out.write(',\n'.join(f'  {item}' for item in all_items))
+    out.write('\n);\n\n')
+
+    # Add indexes after table
+    for idx in table.indexes:
+        if not idx.startswith('-- FK index'):
+            out.write(idx)
+            out.write('\n')
+
+    return out.getvalue()
+
+def _map_in_windows(executor, fn, items, window):
+    """executor.map over items, submitting at most window items at a time"""
+
+    items = iter(items)
+    while True:
+        batch = list(islice(items, window))
+        if not batch:
+            return
+        yield from executor.map(fn, batch, chunksize=8)
+
+def convert_mysql_to_postgres(lines, out, executor=None, window=256):
+    """Convert MySQL CREATE TABLE statements to PostgreSQL, writing to out
+
+    Tables are independent of each other, so when an executor is given they
+    are converted through it and written back in input order. Only window
+    tables are handed to the executor at a time, so the input is still
+    streamed rather than read whole. Returns the number of tables converted.
+    """
+
+    blocks = iter_table_blocks(lines)
+    if executor is None:
+        converted = map(_convert_one_table, blocks)
+    else:
+        converted = _map_in_windows(executor, _convert_one_table, blocks, window)
+
+    tables = 0
+    for table_sql in converted:
+        out.write(table_sql)
+        tables += 1
+
+    return tables
 
 if __name__ == '__main__':
-    # Read MySQL schema
-    with open('schema/baseline/otrs_mysql_structure.sql', 'r') as f:
-        mysql_sql = f.read()
-    
-    # Convert to PostgreSQL
-    postgres_sql = convert_mysql_to_postgres(mysql_sql)
-    
-    # Write PostgreSQL schema
-    with open('schema/baseline/otrs_complete.sql', 'w') as f:
-        f.write(postgres_sql)
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=1,
+        help='convert tables in this many worker processes (default: 1, '
+             'serial; only worth it for dumps far larger than the baseline)',
+    )
+    args = parser.parse_args()
+
+    # Stream the MySQL schema into the PostgreSQL schema
+    with open('schema/baseline/otrs_mysql_structure.sql', 'r') as fin, \
+            open('schema/baseline/otrs_complete.sql', 'w') as fout:
+        if args.jobs > 1:
+            with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+                tables = convert_mysql_to_postgres(fin, fout, executor)
+        else:
+            tables = convert_mysql_to_postgres(fin, fout)
     
-    print(f"Converted {mysql_sql.count('CREATE TABLE')} tables to PostgreSQL")
\ No newline at end of file
+    print(f"Converted {tables} tables to PostgreSQL")
@@ -2,11 +2,16 @@
 """
 Generate colorful grouped Makefile help output.
 """
+import functools
+import hashlib
 import os
 import pathlib
 import re
 import subprocess
-from typing import Dict, Iterable, List, Set
+import sys
+import tempfile
+import types
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Set, Tuple
 
 RESET = "\033[0m"
 BOLD = "\033[1m"
@@ -18,6 +23,8 @@ CYAN = "\033[0;36m"
 ROOT = pathlib.Path(__file__).resolve().parents[2]
 LOGO_PATH = ROOT / "logo.txt"
 MAKEFILE_PATH = ROOT / "Makefile"
+# Per-user, never the shared temp dir: cached target names are printed as-is.
+CACHE_DIR = pathlib.Path(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")) / "gotrs-make-help"
 
 # ---------------------------------------------------------------------------
 # Human‑curated help metadata. Commands not listed here fall back to the
@@ -39,6 +46,7 @@ GROUPS: List[Dict[str, object]] = [
             {"name": "restart", "description": "Rebuild (if needed) and restart core services"},
             {"name": "clean", "description": "Remove containers, volumes, caches, and generated artifacts"},
             {"name": "setup", "description": "Initial project bootstrap with secure secrets"},
+            {"name": "help-rebuild", "description": "Regenerate the cached output shown by make help"},
             {"name": "build", "description": "Build production images with cached layers"},
             {"name": "debug-env", "description": "Show container runtime / compose diagnostics"},
             {
@@ -343,12 +351,32 @@ GROUPS: List[Dict[str, object]] = [
     },
 ]
 
-IGNORE_TARGETS: Set[str] = {".PHONY", "FORCE"}
+IGNORE_TARGETS: FrozenSet[str] = frozenset({".PHONY", "FORCE"})
+
+# Leading words of undocumented targets that map to a nicer verb.
+PREFIX_VERBS: Mapping[str, str] = types.MappingProxyType(
+    {
+        "test": "Test",
+        "db": "Database",
+        "schema": "Schema",
+        "migrate": "Migrate",
+        "reset": "Reset",
+        "setup": "Setup",
+        "build": "Build",
+        "clean": "Clean",
+    }
+)
+# Rule headers in the "# Files" section of `make -pq`; pattern rules (with
+# "%") and special targets (leading ".") never match.
+TARGET_RE = re.compile(r"(?m)^([A-Za-z0-9_][A-Za-z0-9_\-./ ]*?):[^=]")
+CAMEL_CASE_RE = re.compile(r"([a-z])([A-Z])")
+WORD_SEPARATORS = str.maketrans("-_", "  ")
 
 # ---------------------------------------------------------------------------
 # Helper functions
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def read_logo() -> str:
     try:
         return LOGO_PATH.read_text()
@@ -356,130 +384,178 @@ def read_logo() -> str:
         return "  🐐 GOTRS - Go Open Ticketing Resource System"
 
 
-def iter_targets_from_makefile() -> Set[str]:
-    result = subprocess.run(["make", "-pq"], cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+def parse_make_database(output: str) -> Set[str]:
+    start = output.find("# Files")
+    if start < 0:
+        return set()
     targets: Set[str] = set()
-    capture = False
-    for line in result.stdout.splitlines():
-        if line.startswith("# Files"):
-            capture = True
-            continue
-        if not capture:
-            continue
-        if not line or line.startswith("#") or line[0].isspace():
-            continue
-        if ":" not in line:
-            continue
-        lhs = line.split(":", 1)[0]
-        if not lhs or lhs.startswith("."):
-            continue
-        if "%" in lhs:
-            continue
-        for candidate in lhs.split():
-            if candidate and candidate not in IGNORE_TARGETS:
-                targets.add(candidate.strip())
+    for match in TARGET_RE.finditer(output, start):
+        for candidate in match.group(1).split():
+            if candidate not in IGNORE_TARGETS:
+                targets.add(candidate)
+    return targets
+
+
+def target_cache_prefix() -> str:
+    # The cache directory is shared between checkouts; entries are namespaced
+    # by Makefile path so each checkout only ever replaces its own.
+    checkout = hashlib.sha1(str(MAKEFILE_PATH).encode()).hexdigest()[:16]
+    return f"make_targets_{checkout}"
+
+
+def target_cache_path() -> pathlib.Path:
+    stat = MAKEFILE_PATH.stat()
+    version = hashlib.sha1(f"{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{target_cache_prefix()}_{version}.txt"
+
+
+def cache_dir_is_private() -> bool:
+    # Only trust a cache directory that belongs to us and that no other user
+    # can write into; anything read from it ends up on the terminal.
+    try:
+        info = CACHE_DIR.stat()
+    except OSError:
+        return False
+    getuid = getattr(os, "getuid", None)
+    if getuid is not None and info.st_uid != getuid():
+        return False
+    return not info.st_mode & 0o022
+
+
+def iter_targets_from_makefile() -> Set[str]:
+    # `make -pq` dominates the runtime of `make help`, so the parsed target
+    # set is cached until the Makefile changes.
+    try:
+        cache_path = target_cache_path()
+    except OSError:
+        cache_path = None
+    if cache_path is not None and cache_dir_is_private() and cache_path.is_file():
+        try:
+            return set(cache_path.read_text().split())
+        except OSError:
+            pass
+
+    # Captured as bytes and decoded once; the database dump can run to megabytes.
+    result = subprocess.run(["make", "-pq"], cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    targets = parse_make_database(result.stdout.decode("utf-8", errors="replace"))
+
+    # An empty set means `make -pq` failed or printed no database; caching it
+    # would hide every undocumented target until the Makefile changes.
+    if cache_path is not None and targets:
+        try:
+            CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not cache_dir_is_private():
+                return targets
+            fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, prefix=".make_targets_")
+            with os.fdopen(fd, "w") as tmp:
+                tmp.write("\n".join(sorted(targets)))
+            os.replace(tmp_name, cache_path)
+            for stale in CACHE_DIR.glob(f"{target_cache_prefix()}_*.txt"):
+                if stale != cache_path:
+                    stale.unlink()
+        except OSError:
+            pass
     return targets
 
 
 def flatten_documented_targets(groups: Iterable[Dict[str, object]]) -> Set[str]:
-    documented: Set[str] = set()
-    for group in groups:
-        for entry in group.get("entries", []):
-            name = entry.get("name")
-            if isinstance(name, str) and name:
-                documented.add(name)
-    return documented
+    return {
+        entry["name"]
+        for group in groups
+        for entry in group.get("entries", [])
+        if isinstance(entry.get("name"), str) and entry["name"]
+    }
+
+
+def entry_label(entry: GroupEntry) -> str:
+    usage = entry.get("usage")
+    if usage:
+        return str(usage)
+    name = entry.get("name")
+    if name:
+        return f"make {name}"
+    return str(entry.get("label", ""))
+
+
+def prepare_entries(entries: Iterable[GroupEntry]) -> List[Tuple[str, str]]:
+    return [(entry_label(entry), str(entry.get("description", ""))) for entry in entries]
+
+
+def describe_target(name: str) -> str:
+    """Generate human‑readable description for undocumented targets."""
+    words = CAMEL_CASE_RE.sub(r"\1 \2", name).translate(WORD_SEPARATORS).split()
+    if not words:
+        return f"Run {name}"
+    verb = PREFIX_VERBS.get(words[0])
+    if verb:
+        rest = " ".join(words[1:])
+        return f"{verb} {rest}" if rest else verb
+    return f"Run {name.replace('-', ' ')}"
 
 
-def render_group(title: str, emoji: str, entries: List[GroupEntry], width: int) -> str:
+def render_group(title: str, emoji: str, entries: List[Tuple[str, str]], width: int) -> str:
     lines: List[str] = []
     header = f"  {MAGENTA}{'━' * 40}{RESET}"
     lines.append(header)
     lines.append(f"  {MAGENTA}{emoji} {title}{RESET}")
     lines.append(header)
     lines.append("")
-    for entry in entries:
-        usage = entry.get("usage")
-        name = entry.get("name")
-        if usage:
-            label = usage
-        elif name:
-            label = f"make {name}"
-        else:
-            label = str(entry.get("label", ""))
-        description = entry.get("description", "")
-        label_fmt = f"  {GREEN}{label:<{width}}{RESET}"
-        lines.append(label_fmt + f" {description}")
+    for label, description in entries:
+        lines.append(f"  {GREEN}{label:<{width}}{RESET} {description}")
     lines.append("")
     return "\n".join(lines)
 
+
+# GROUPS is static, so its (label, description) pairs are built once at import.
+PREPARED_GROUPS: List[Tuple[str, str, List[Tuple[str, str]]]] = [
+    (str(group["title"]), str(group["emoji"]), prepare_entries(group.get("entries", [])))
+    for group in GROUPS
+]
+
 # ---------------------------------------------------------------------------
 # Main logic
 # ---------------------------------------------------------------------------
 
-def main() -> None:
+def main(runtime_env: bool = True) -> None:
+    """Render help; with runtime_env=False the container/compose commands are
+    left as @CONTAINER_CMD@/@COMPOSE_CMD@ placeholders so the output can be
+    baked into help.txt and filled in by `make help`."""
+    # Output is collected and written in one go rather than print() per section.
+    parts: List[str] = []
     logo = read_logo()
-    print("\n" + logo + "\n")
+    parts.append("\n" + logo + "\n")
+    parts.append("\n")
 
     documented = flatten_documented_targets(GROUPS)
     all_targets = iter_targets_from_makefile()
     missing = sorted(all_targets - documented - IGNORE_TARGETS)
 
+    other_entries = [(f"make {target}", describe_target(target)) for target in missing]
+
     # Build size for alignment (consider documented labels + missing "make target").
-    labels: List[str] = []
-    for group in GROUPS:
-        for entry in group.get("entries", []):
-            if entry.get("usage"):
-                labels.append(entry["usage"])
-            elif entry.get("name"):
-                labels.append(f"make {entry['name']}")
-            elif entry.get("label"):
-                labels.append(str(entry.get("label")))
-    labels.extend([f"make {t}" for t in missing])
+    labels = [label for _, _, entries in PREPARED_GROUPS for label, _ in entries]
+    labels.extend(label for label, _ in other_entries)
     width = max((len(label) for label in labels), default=0) + 2
 
-    for group in GROUPS:
-        print(render_group(group["title"], group["emoji"], group.get("entries", []), width))
-
-    if missing:
-        # Generate human‑readable description for undocumented targets.
-        def describe_target(name: str) -> str:
-            words = re.sub(r"([a-z])([A-Z])", r"\1 \2", name).replace("-", " ").replace("_", " ")
-            words = words.split()
-            if not words:
-                return f"Run {name}"
-            prefix_map = {
-                "test": "Test",
-                "db": "Database",
-                "schema": "Schema",
-                "migrate": "Migrate",
-                "reset": "Reset",
-                "setup": "Setup",
-                "build": "Build",
-                "clean": "Clean",
-            }
-            first = words[0]
-            if first in prefix_map:
-                verb = prefix_map[first]
-                rest = " ".join(words[1:])
-                return f"{verb} {rest}" if rest else verb
-            return f"Run {name.replace('-', ' ')}"
-
-        other_entries = [
-            {
-                "name": target,
-                "description": describe_target(target),
-            }
-            for target in missing
-        ]
-        print(render_group("Other Targets", "🧩", other_entries, width))
-
-    print(f"  {CYAN}🐐 Happy coding with GOTRS!{RESET}")
-    container_cmd = os.environ.get("CONTAINER_CMD") or "configure CONTAINER_CMD"
-    compose_cmd = os.environ.get("COMPOSE_CMD") or "configure COMPOSE_CMD"
-    print(
-        f"  {DIM}Container Runtime: {container_cmd} | Compose Tool: {compose_cmd} | Toolbox: make toolbox-build{RESET}"
+    for title, emoji, entries in PREPARED_GROUPS:
+        parts.append(render_group(title, emoji, entries, width))
+        parts.append("\n")
+
+    if other_entries:
+        parts.append(render_group("Other Targets", "🧩", other_entries, width))
+        parts.append("\n")
+
+    parts.append(f"  {CYAN}🐐 Happy coding with GOTRS!{RESET}\n")
+    if runtime_env:
+        container_cmd = os.environ.get("CONTAINER_CMD") or "configure CONTAINER_CMD"
+        compose_cmd = os.environ.get("COMPOSE_CMD") or "configure COMPOSE_CMD"
+    else:
+        container_cmd = "@CONTAINER_CMD@"
+        compose_cmd = "@COMPOSE_CMD@"
+    parts.append(
+        f"  {DIM}Container Runtime: {container_cmd} | Compose Tool: {compose_cmd} | Toolbox: make toolbox-build{RESET}\n"
     )
+    sys.stdout.write("".join(parts))
 
 if __name__ == "__main__":
-    main()
+    main(runtime_env="--no-runtime-env" not in sys.argv[1:])
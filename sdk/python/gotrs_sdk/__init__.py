@@ -24,7 +24,12 @@ Authentication:
     await client.login("user@example.com", "password")
 """
 
-from .client import GotrsClient
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+# Exceptions are plain Python and are needed by the is_* helpers below, so
+# they are imported eagerly; everything that pulls in httpx or pydantic is
+# resolved lazily on first attribute access.
 from .exceptions import (
     GotrsError,
     ValidationError,
@@ -35,31 +40,81 @@ from .exceptions import (
     ForbiddenError,
     RateLimitError,
 )
-from .models import (
-    Ticket,
-    TicketMessage,
-    User,
-    Queue,
-    Attachment,
-    Group,
-    DashboardStats,
-    SearchResult,
-    InternalNote,
-    NoteTemplate,
-    LDAPUser,
-    LDAPSyncResult,
-    Webhook,
-    WebhookDelivery,
-    TicketCreateRequest,
-    TicketUpdateRequest,
-    TicketListOptions,
-    MessageCreateRequest,
-    UserCreateRequest,
-    UserUpdateRequest,
-    AuthLoginRequest,
-    AuthLoginResponse,
-)
-from .auth import APIKeyAuth, JWTAuth, OAuth2Auth
+
+if TYPE_CHECKING:
+    from .client import GotrsClient
+    from .models import (
+        Ticket,
+        TicketMessage,
+        User,
+        Queue,
+        Attachment,
+        Group,
+        DashboardStats,
+        SearchResult,
+        InternalNote,
+        NoteTemplate,
+        LDAPUser,
+        LDAPSyncResult,
+        Webhook,
+        WebhookDelivery,
+        TicketCreateRequest,
+        TicketUpdateRequest,
+        TicketListOptions,
+        MessageCreateRequest,
+        UserCreateRequest,
+        UserUpdateRequest,
+        AuthLoginRequest,
+        AuthLoginResponse,
+    )
+    from .auth import APIKeyAuth, JWTAuth, OAuth2Auth
+
+# Public name -> submodule it is loaded from
+_LAZY: Dict[str, str] = {
+    # Main client
+    "GotrsClient": ".client",
+    # Models
+    "Ticket": ".models",
+    "TicketMessage": ".models",
+    "User": ".models",
+    "Queue": ".models",
+    "Attachment": ".models",
+    "Group": ".models",
+    "DashboardStats": ".models",
+    "SearchResult": ".models",
+    "InternalNote": ".models",
+    "NoteTemplate": ".models",
+    "LDAPUser": ".models",
+    "LDAPSyncResult": ".models",
+    "Webhook": ".models",
+    "WebhookDelivery": ".models",
+    "TicketCreateRequest": ".models",
+    "TicketUpdateRequest": ".models",
+    "TicketListOptions": ".models",
+    "MessageCreateRequest": ".models",
+    "UserCreateRequest": ".models",
+    "UserUpdateRequest": ".models",
+    "AuthLoginRequest": ".models",
+    "AuthLoginResponse": ".models",
+    # Auth
+    "APIKeyAuth": ".auth",
+    "JWTAuth": ".auth",
+    "OAuth2Auth": ".auth",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access and cache them."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
 
 __version__ = "1.0.0"
 __author__ = "GOTRS Team"
@@ -108,34 +163,63 @@ __all__ = [
 ]
 
 # Convenience functions for error checking
+
+# Exception class -> tag returned by classify_error
+_ERROR_TAGS: Dict[type, str] = {
+    NotFoundError: "not_found",
+    UnauthorizedError: "unauthorized",
+    ForbiddenError: "forbidden",
+    RateLimitError: "rate_limit",
+    ValidationError: "validation",
+    NetworkError: "network",
+    TimeoutError: "timeout",
+}
+
+
+def classify_error(error: Exception) -> Optional[str]:
+    """Classify an exception with a single lookup.
+    
+    Returns one of "not_found", "unauthorized", "forbidden", "rate_limit",
+    "validation", "network" or "timeout"; "gotrs" for any other GOTRS API
+    error, and None for exceptions that are not GOTRS errors.
+    """
+    tag = _ERROR_TAGS.get(type(error))
+    if tag is not None:
+        return tag
+    # Subclasses of the known errors
+    for error_class, tag in _ERROR_TAGS.items():
+        if isinstance(error, error_class):
+            return tag
+    return "gotrs" if isinstance(error, GotrsError) else None
+
 def is_gotrs_error(error: Exception) -> bool:
     """Check if an exception is a GOTRS API error."""
     return isinstance(error, GotrsError)
 
 def is_not_found_error(error: Exception) -> bool:
     """Check if an exception is a 404 Not Found error."""
-    return isinstance(error, NotFoundError)
+    return type(error) is NotFoundError or isinstance(error, NotFoundError)
 
 def is_unauthorized_error(error: Exception) -> bool:
     """Check if an exception is a 401 Unauthorized error."""
-    return isinstance(error, UnauthorizedError)
+    return type(error) is UnauthorizedError or isinstance(error, UnauthorizedError)
 
 def is_forbidden_error(error: Exception) -> bool:
     """Check if an exception is a 403 Forbidden error."""
-    return isinstance(error, ForbiddenError)
+    return type(error) is ForbiddenError or isinstance(error, ForbiddenError)
 
 def is_rate_limit_error(error: Exception) -> bool:
     """Check if an exception is a 429 Rate Limit error."""
-    return isinstance(error, RateLimitError)
+    return type(error) is RateLimitError or isinstance(error, RateLimitError)
 
 def is_validation_error(error: Exception) -> bool:
     """Check if an exception is a validation error."""
-    return isinstance(error, ValidationError)
+    return type(error) is ValidationError or isinstance(error, ValidationError)
 
 def is_network_error(error: Exception) -> bool:
     """Check if an exception is a network error."""
-    return isinstance(error, NetworkError)
+    return type(error) is NetworkError or isinstance(error, NetworkError)
 
 def is_timeout_error(error: Exception) -> bool:
     """Check if an exception is a timeout error."""
-    return isinstance(error, TimeoutError)
\ No newline at end of file
+    return type(error) is TimeoutError or isinstance(error, TimeoutError)
@@ -1,8 +1,9 @@
 """Authentication classes for the GOTRS SDK."""
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional, Dict, Any, Callable, Awaitable, Union
 
 from .exceptions import AuthenticationError
@@ -11,9 +12,14 @@ from .exceptions import AuthenticationError
 class Authenticator(ABC):
     """Base class for authentication methods."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_auth_headers(self) -> Dict[str, str]:
-        """Get authentication headers for requests."""
+        """Get authentication headers for requests.
+        
+        Implementations may return a shared dict; callers must not mutate it.
+        """
         pass
     
     @abstractmethod
@@ -36,13 +42,36 @@ class Authenticator(ABC):
 class APIKeyAuth(Authenticator):
     """API key authentication."""
     
+    __slots__ = ("_api_key", "_header_name", "_headers")
+    
     def __init__(self, api_key: str, header_name: str = "X-API-Key") -> None:
-        self.api_key = api_key
-        self.header_name = header_name
+        self._api_key = api_key
+        self._header_name = header_name
+        self._headers = {header_name: api_key}
+    
+    @property
+    def api_key(self) -> str:
+        """The API key sent with each request."""
+        return self._api_key
+    
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        self._api_key = value
+        self._headers = {self._header_name: value}
+    
+    @property
+    def header_name(self) -> str:
+        """The header the API key is sent in."""
+        return self._header_name
+    
+    @header_name.setter
+    def header_name(self, value: str) -> None:
+        self._header_name = value
+        self._headers = {value: self._api_key}
     
     def get_auth_headers(self) -> Dict[str, str]:
-        """Get API key headers."""
-        return {self.header_name: self.api_key}
+        """Get API key headers (shared, do not mutate)."""
+        return self._headers
     
     def is_expired(self) -> bool:
         """API keys don't expire."""
@@ -57,39 +86,79 @@ class APIKeyAuth(Authenticator):
         return "api-key"
 
 
-class JWTAuth(Authenticator):
-    """JWT token authentication with automatic refresh."""
+class _BearerAuth(Authenticator):
+    """Shared implementation of refreshable token authentication."""
+    
+    __slots__ = (
+        "_access_token",
+        "refresh_token",
+        "_token_type",
+        "_expires_at",
+        "_expires_at_ts",
+        "refresh_function",
+        "_refresh_lock",
+        "_headers",
+    )
     
     def __init__(
         self,
-        token: str,
+        access_token: str,
         refresh_token: Optional[str] = None,
+        token_type: str = "Bearer",
         expires_at: Optional[datetime] = None,
         refresh_function: Optional[
             Callable[[str], Awaitable[Dict[str, Any]]]
         ] = None,
     ) -> None:
-        self.token = token
+        self._token_type = token_type
+        self.access_token = access_token
         self.refresh_token = refresh_token
         self.expires_at = expires_at
         self.refresh_function = refresh_function
         self._refresh_lock = asyncio.Lock()
     
+    @property
+    def access_token(self) -> str:
+        """The current access token."""
+        return self._access_token
+    
+    @access_token.setter
+    def access_token(self, value: str) -> None:
+        self._access_token = value
+        self._headers = {"Authorization": f"{self._token_type} {value}"}
+    
+    @property
+    def token_type(self) -> str:
+        """The authorization scheme the token is sent with."""
+        return self._token_type
+    
+    @token_type.setter
+    def token_type(self, value: str) -> None:
+        self._token_type = value
+        self._headers = {"Authorization": f"{value} {self._access_token}"}
+    
+    @property
+    def expires_at(self) -> Optional[datetime]:
+        """When the token expires, if known."""
+        return self._expires_at
+    
+    @expires_at.setter
+    def expires_at(self, value: Optional[datetime]) -> None:
+        self._expires_at = value
+        self._expires_at_ts = value.timestamp() if value else None
+    
     def get_auth_headers(self) -> Dict[str, str]:
-        """Get JWT authorization headers."""
-        return {"Authorization": f"Bearer {self.token}"}
+        """Get authorization headers (shared, do not mutate)."""
+        return self._headers
     
     def is_expired(self) -> bool:
-        """Check if the JWT token is expired."""
-        if not self.expires_at:
-            return False
-        
-        # Add 1 minute buffer
-        buffer_time = datetime.now(timezone.utc).timestamp() + 60
-        return self.expires_at.timestamp() <= buffer_time
+        """Check if the token is expired."""
+        # Compared as POSIX seconds, with a 1 minute buffer
+        ts = self._expires_at_ts
+        return ts is not None and ts <= time.time() + 60
     
     async def refresh(self) -> None:
-        """Refresh the JWT token."""
+        """Refresh the token."""
         if not self.refresh_function or not self.refresh_token:
             raise AuthenticationError("No refresh function or refresh token available")
         
@@ -100,7 +169,7 @@ class JWTAuth(Authenticator):
             
             try:
                 result = await self.refresh_function(self.refresh_token)
-                self.token = result["access_token"]
+                self.access_token = result["access_token"]
                 self.refresh_token = result.get("refresh_token", self.refresh_token)
                 
                 if "expires_at" in result:
@@ -113,70 +182,47 @@ class JWTAuth(Authenticator):
                         
             except Exception as e:
                 raise AuthenticationError(f"Failed to refresh token: {e}") from e
-    
-    @property
-    def auth_type(self) -> str:
-        return "jwt"
 
 
-class OAuth2Auth(Authenticator):
-    """OAuth2 token authentication."""
+class JWTAuth(_BearerAuth):
+    """JWT token authentication with automatic refresh."""
+    
+    __slots__ = ()
     
     def __init__(
         self,
-        access_token: str,
+        token: str,
         refresh_token: Optional[str] = None,
-        token_type: str = "Bearer",
         expires_at: Optional[datetime] = None,
         refresh_function: Optional[
             Callable[[str], Awaitable[Dict[str, Any]]]
         ] = None,
     ) -> None:
-        self.access_token = access_token
-        self.refresh_token = refresh_token
-        self.token_type = token_type
-        self.expires_at = expires_at
-        self.refresh_function = refresh_function
-        self._refresh_lock = asyncio.Lock()
+        super().__init__(
+            token,
+            refresh_token=refresh_token,
+            expires_at=expires_at,
+            refresh_function=refresh_function,
+        )
     
-    def get_auth_headers(self) -> Dict[str, str]:
-        """Get OAuth2 authorization headers."""
-        return {"Authorization": f"{self.token_type} {self.access_token}"}
+    @property
+    def token(self) -> str:
+        """The current JWT (alias of access_token)."""
+        return self.access_token
     
-    def is_expired(self) -> bool:
-        """Check if the OAuth2 token is expired."""
-        if not self.expires_at:
-            return False
-        
-        # Add 1 minute buffer
-        buffer_time = datetime.now(timezone.utc).timestamp() + 60
-        return self.expires_at.timestamp() <= buffer_time
+    @token.setter
+    def token(self, value: str) -> None:
+        self.access_token = value
     
-    async def refresh(self) -> None:
-        """Refresh the OAuth2 token."""
-        if not self.refresh_function or not self.refresh_token:
-            raise AuthenticationError("No refresh function or refresh token available")
-        
-        async with self._refresh_lock:
-            # Check again in case another coroutine already refreshed
-            if not self.is_expired():
-                return
-            
-            try:
-                result = await self.refresh_function(self.refresh_token)
-                self.access_token = result["access_token"]
-                self.refresh_token = result.get("refresh_token", self.refresh_token)
-                
-                if "expires_at" in result:
-                    if isinstance(result["expires_at"], str):
-                        self.expires_at = datetime.fromisoformat(
-                            result["expires_at"].replace("Z", "+00:00")
-                        )
-                    else:
-                        self.expires_at = result["expires_at"]
-                        
-            except Exception as e:
-                raise AuthenticationError(f"Failed to refresh token: {e}") from e
+    @property
+    def auth_type(self) -> str:
+        return "jwt"
+
+
+class OAuth2Auth(_BearerAuth):
+    """OAuth2 token authentication."""
+    
+    __slots__ = ()
     
     @property
     def auth_type(self) -> str:
@@ -186,9 +232,13 @@ class OAuth2Auth(Authenticator):
 class NoAuth(Authenticator):
     """No authentication."""
     
+    __slots__ = ()
+    
+    _HEADERS: Dict[str, str] = {}
+    
     def get_auth_headers(self) -> Dict[str, str]:
-        """Return empty headers."""
-        return {}
+        """Return empty headers (shared, do not mutate)."""
+        return self._HEADERS
     
     def is_expired(self) -> bool:
         """Never expires."""
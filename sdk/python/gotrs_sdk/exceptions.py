@@ -22,12 +22,21 @@ class GotrsError(Exception):
         self.response_data = response_data
     
     def __str__(self) -> str:
-        base_msg = self.message
-        if self.status_code:
-            base_msg = f"HTTP {self.status_code}: {base_msg}"
-        if self.details:
-            base_msg = f"{base_msg} - {self.details}"
-        return base_msg
+        # Built once on first use; error messages are often stringified
+        # repeatedly by logging and retry reporting.
+        text = self.__dict__.get("_str_cache")
+        if text is None:
+            status_code, details, message = self.status_code, self.details, self.message
+            if status_code and details:
+                text = f"HTTP {status_code}: {message} - {details}"
+            elif status_code:
+                text = f"HTTP {status_code}: {message}"
+            elif details:
+                text = f"{message} - {details}"
+            else:
+                text = message
+            self._str_cache = text
+        return text
     
     def __repr__(self) -> str:
         return (
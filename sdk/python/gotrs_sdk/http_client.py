@@ -1,11 +1,12 @@
 """HTTP client for the GOTRS SDK."""
 
 import asyncio
-from typing import Any, Dict, Optional, Union, Type, TypeVar, List
-from urllib.parse import urljoin, urlencode
+import logging
+import random
+from typing import Any, AsyncIterator, Callable, Dict, List, NoReturn, Optional, Tuple, Type, TypeVar, Union
 
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from .auth import Authenticator, NoAuth
 from .exceptions import (
@@ -18,10 +19,79 @@ from .exceptions import (
     RateLimitError,
     ServerError,
 )
-from .models import APIResponse
+
+# orjson decodes response bytes considerably faster than the stdlib; it is
+# an optional dependency (pip install gotrs-sdk[speedups]). Without it the
+# JSON parser bundled with pydantic-core is still quicker than json.loads.
+_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    try:
+        from pydantic_core import from_json
+
+        _loads = from_json
+    except ImportError:  # pydantic-core < 2.14
+        import json
+
+        _loads = json.loads
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# Status codes that map directly onto a dedicated exception class
+_ERROR_MAP: Dict[int, Type[GotrsError]] = {
+    404: NotFoundError,
+    401: UnauthorizedError,
+    403: ForbiddenError,
+}
+
+# Retry backoff bounds in seconds
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+
+
+def _backoff_delay(previous: float) -> float:
+    """Next retry delay using decorrelated jitter.
+    
+    Randomising the delay keeps many clients that failed together from
+    retrying in lockstep against an overloaded server.
+    """
+    upper = min(_BACKOFF_CAP, max(previous * 3, _BACKOFF_BASE))
+    return random.uniform(_BACKOFF_BASE, upper)
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Delay requested by a 429/503 response's Retry-After header, if any."""
+    if response.status_code not in (429, 503):
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        # HTTP-date values are not supported; fall back to backoff
+        return None
+    return seconds if seconds >= 0 else None
+
+
+# Validators per (model class, is_list), built on first use
+_ADAPTERS: Dict[Tuple[type, bool], TypeAdapter] = {}
+
+
+def _adapter(model_class: type, is_list: bool) -> TypeAdapter:
+    """Get the cached adapter validating model_class or a list of it in one call."""
+    key = (model_class, is_list)
+    adapter = _ADAPTERS.get(key)
+    if adapter is None:
+        adapter = TypeAdapter(List[model_class] if is_list else model_class)  # type: ignore[valid-type]
+        _ADAPTERS[key] = adapter
+    return adapter
+
 
 class HTTPClient:
     """HTTP client for making requests to the GOTRS API."""
@@ -34,18 +104,44 @@ class HTTPClient:
         retries: int = 3,
         user_agent: str = "gotrs-python-sdk/1.0.0",
         debug: bool = False,
+        http2: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
     ) -> None:
+        """Create the client.
+        
+        With http2 enabled (the default, via the httpx[http2] dependency)
+        concurrent requests to the API share one multiplexed connection;
+        the pool limits bound how many connections are opened and kept alive.
+        """
         self.base_url = base_url.rstrip("/")
         self.auth = auth or NoAuth()
         self.timeout = timeout
         self.retries = retries
         self.user_agent = user_agent
         self.debug = debug
+        if debug:
+            # Backward-compatible switch: surface retry messages even when the
+            # application has not configured logging.
+            logger.setLevel(logging.DEBUG)
+            if not logger.hasHandlers():
+                logger.addHandler(logging.StreamHandler())
+        
+        # Content-Type + auth headers, reused while the auth headers are unchanged
+        self._base_headers: Optional[Dict[str, str]] = None
+        self._base_auth_headers: Optional[Dict[str, str]] = None
         
-        # Create HTTP client
+        # Create HTTP client; request paths are resolved against base_url by httpx
         self._client = httpx.AsyncClient(
+            base_url=self.base_url + "/",
             timeout=httpx.Timeout(timeout),
             headers={"User-Agent": user_agent},
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=30.0,
+            ),
             follow_redirects=True,
         )
     
@@ -64,61 +160,64 @@ class HTTPClient:
     def set_auth(self, auth: Authenticator) -> None:
         """Set the authentication method."""
         self.auth = auth
+        self._base_headers = None
     
     async def _prepare_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        """Prepare headers with authentication."""
-        final_headers = {"Content-Type": "application/json"}
+        """Prepare headers with authentication.
         
-        if headers:
-            final_headers.update(headers)
-        
-        # Add authentication headers
+        Without extra headers the cached base headers are returned as-is, so
+        the result must be treated as read-only.
+        """
         if self.auth.is_expired():
             await self.auth.refresh()
+            self._base_headers = None
         
+        # Authenticators hand out the same dict until their credentials
+        # change, so an identity check is enough to detect a stale cache.
         auth_headers = self.auth.get_auth_headers()
-        final_headers.update(auth_headers)
-        
-        return final_headers
-    
-    def _build_url(self, path: str, params: Optional[Dict[str, Any]] = None) -> str:
-        """Build the full URL for a request."""
-        url = urljoin(self.base_url + "/", path.lstrip("/"))
+        if self._base_headers is None or auth_headers is not self._base_auth_headers:
+            self._base_headers = {"Content-Type": "application/json", **auth_headers}
+            self._base_auth_headers = auth_headers
         
-        if params:
-            # Filter out None values and convert to strings
-            clean_params = {}
-            for key, value in params.items():
-                if value is not None:
-                    if isinstance(value, list):
-                        clean_params[key] = ",".join(str(v) for v in value)
-                    else:
-                        clean_params[key] = str(value)
-            
-            if clean_params:
-                url += "?" + urlencode(clean_params)
+        if not headers:
+            return self._base_headers
         
-        return url
+        # Authentication headers take precedence over caller-supplied ones
+        return {"Content-Type": "application/json", **headers, **auth_headers}
     
-    def _handle_error(self, response: httpx.Response) -> None:
-        """Handle HTTP error responses."""
+    @staticmethod
+    def _query_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Drop None values and comma-join lists; httpx encodes the rest."""
+        if not params:
+            return None
+        return {
+            key: ",".join(map(str, value)) if type(value) is list else value
+            for key, value in params.items()
+            if value is not None
+        }
+    
+    def _handle_error(self, response: httpx.Response) -> NoReturn:
+        """Raise the exception matching an HTTP error response."""
         status_code = response.status_code
         
-        try:
-            error_data = response.json()
-        except Exception:
+        # Only attempt to decode bodies that claim to be JSON; HTML and plain
+        # text error pages would otherwise raise and be caught every time.
+        error_data = None
+        if "json" in response.headers.get("content-type", ""):
+            try:
+                error_data = _loads(response.content)
+            except Exception:
+                pass
+        if error_data is None:
             error_data = {"error": response.text or "Unknown error"}
         
         message = error_data.get("message", error_data.get("error", "Unknown error"))
         code = error_data.get("code", "")
         details = error_data.get("details", "")
         
-        if status_code == 404:
-            raise NotFoundError(message, details=details, response_data=error_data)
-        elif status_code == 401:
-            raise UnauthorizedError(message, details=details, response_data=error_data)
-        elif status_code == 403:
-            raise ForbiddenError(message, details=details, response_data=error_data)
+        error_class = _ERROR_MAP.get(status_code)
+        if error_class is not None:
+            raise error_class(message, details=details, response_data=error_data)
         elif status_code == 429:
             retry_after = None
             if "Retry-After" in response.headers:
@@ -143,29 +242,48 @@ class HTTPClient:
         method: str,
         url: str,
         headers: Dict[str, str],
+        stream: bool = False,
         **kwargs: Any,
     ) -> httpx.Response:
-        """Make a request with retry logic."""
+        """Make a request with retry logic.
+        
+        Only ever returns a successful response; error responses are raised
+        through _handle_error, so callers need no status check of their own.
+        With stream=True the successful response's body is left unread and
+        the caller must close the response.
+        """
         last_exception = None
+        delay = 0.0
         
         for attempt in range(self.retries + 1):
             try:
-                response = await self._client.request(
-                    method, url, headers=headers, **kwargs
-                )
+                request = self._client.build_request(method, url, headers=headers, **kwargs)
+                response = await self._client.send(request, stream=stream)
                 
                 if response.is_success:
                     return response
                 
+                if stream:
+                    # Error bodies are small; reading one also releases the
+                    # connection before the next attempt
+                    await response.aread()
+                
                 # Don't retry client errors (4xx) except for rate limiting
                 if 400 <= response.status_code < 500 and response.status_code != 429:
                     self._handle_error(response)
                 
-                # For server errors and rate limiting, retry with exponential backoff
+                # For server errors and rate limiting, retry with backoff
                 if attempt < self.retries:
-                    delay = 2 ** attempt
-                    if self.debug:
-                        print(f"Request failed (attempt {attempt + 1}), retrying in {delay}s...")
+                    retry_after = _retry_after(response)
+                    if retry_after is None:
+                        delay = _backoff_delay(delay)
+                    elif retry_after <= _BACKOFF_CAP:
+                        delay = retry_after
+                    else:
+                        # Waiting that long would stall the call; surface the
+                        # error (with its Retry-After) to the caller instead
+                        self._handle_error(response)
+                    logger.debug("Request failed (attempt %d), retrying in %.2fs", attempt + 1, delay)
                     await asyncio.sleep(delay)
                     continue
                 
@@ -175,17 +293,15 @@ class HTTPClient:
             except httpx.TimeoutException as e:
                 last_exception = TimeoutError(f"Request timed out after {self.timeout}s")
                 if attempt < self.retries:
-                    delay = 2 ** attempt
-                    if self.debug:
-                        print(f"Request timed out (attempt {attempt + 1}), retrying in {delay}s...")
+                    delay = _backoff_delay(delay)
+                    logger.debug("Request timed out (attempt %d), retrying in %.2fs", attempt + 1, delay)
                     await asyncio.sleep(delay)
                     continue
             except httpx.NetworkError as e:
                 last_exception = NetworkError(f"Network error: {e}")
                 if attempt < self.retries:
-                    delay = 2 ** attempt
-                    if self.debug:
-                        print(f"Network error (attempt {attempt + 1}), retrying in {delay}s...")
+                    delay = _backoff_delay(delay)
+                    logger.debug("Network error (attempt %d), retrying in %.2fs", attempt + 1, delay)
                     await asyncio.sleep(delay)
                     continue
         
@@ -198,7 +314,7 @@ class HTTPClient:
     def _extract_data(self, response: httpx.Response, model_class: Optional[Type[T]] = None) -> Any:
         """Extract data from response."""
         try:
-            data = response.json()
+            data = _loads(response.content)
         except Exception:
             return response.text
         
@@ -212,15 +328,40 @@ class HTTPClient:
         else:
             result_data = data
         
-        # Parse with Pydantic model if provided
+        # Parse with Pydantic model if provided. Validation runs entirely in
+        # pydantic-core, which is faster than building trusted responses
+        # through model_construct() in Python, so there is no unvalidated path.
         if model_class and result_data is not None:
-            if isinstance(result_data, list):
-                return [model_class.model_validate(item) for item in result_data]
-            else:
-                return model_class.model_validate(result_data)
+            return _adapter(model_class, type(result_data) is list).validate_python(result_data)
         
         return result_data
     
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Any],
+        json: Optional[Any],
+        headers: Optional[Dict[str, str]],
+        model_class: Optional[Type[T]],
+    ) -> Any:
+        """Make a request with a JSON or form body."""
+        request_headers = await self._prepare_headers(headers)
+        
+        kwargs: Dict[str, Any] = {}
+        if json is not None:
+            if isinstance(json, BaseModel):
+                # Serialized straight to JSON by pydantic-core; the prepared
+                # headers already carry Content-Type: application/json.
+                kwargs["content"] = json.model_dump_json(exclude_none=True)
+            else:
+                kwargs["json"] = json
+        elif data is not None:
+            kwargs["data"] = data
+        
+        response = await self._make_request_with_retries(method, path, request_headers, **kwargs)
+        return self._extract_data(response, model_class)
+    
     async def get(
         self,
         path: str,
@@ -228,11 +369,16 @@ class HTTPClient:
         headers: Optional[Dict[str, str]] = None,
         model_class: Optional[Type[T]] = None,
     ) -> Any:
-        """Make a GET request."""
-        url = self._build_url(path, params)
+        """Make a GET request.
+        
+        Without model_class the decoded JSON is returned as plain dicts and
+        lists, skipping model construction for callers that only read it.
+        """
         request_headers = await self._prepare_headers(headers)
         
-        response = await self._make_request_with_retries("GET", url, request_headers)
+        response = await self._make_request_with_retries(
+            "GET", path, request_headers, params=self._query_params(params)
+        )
         return self._extract_data(response, model_class)
     
     async def post(
@@ -244,20 +390,7 @@ class HTTPClient:
         model_class: Optional[Type[T]] = None,
     ) -> Any:
         """Make a POST request."""
-        url = self._build_url(path)
-        request_headers = await self._prepare_headers(headers)
-        
-        kwargs = {}
-        if json is not None:
-            if isinstance(json, BaseModel):
-                kwargs["json"] = json.model_dump(exclude_none=True)
-            else:
-                kwargs["json"] = json
-        elif data is not None:
-            kwargs["data"] = data
-        
-        response = await self._make_request_with_retries("POST", url, request_headers, **kwargs)
-        return self._extract_data(response, model_class)
+        return await self._send("POST", path, data, json, headers, model_class)
     
     async def put(
         self,
@@ -268,20 +401,7 @@ class HTTPClient:
         model_class: Optional[Type[T]] = None,
     ) -> Any:
         """Make a PUT request."""
-        url = self._build_url(path)
-        request_headers = await self._prepare_headers(headers)
-        
-        kwargs = {}
-        if json is not None:
-            if isinstance(json, BaseModel):
-                kwargs["json"] = json.model_dump(exclude_none=True)
-            else:
-                kwargs["json"] = json
-        elif data is not None:
-            kwargs["data"] = data
-        
-        response = await self._make_request_with_retries("PUT", url, request_headers, **kwargs)
-        return self._extract_data(response, model_class)
+        return await self._send("PUT", path, data, json, headers, model_class)
     
     async def delete(
         self,
@@ -290,10 +410,9 @@ class HTTPClient:
         model_class: Optional[Type[T]] = None,
     ) -> Any:
         """Make a DELETE request."""
-        url = self._build_url(path)
         request_headers = await self._prepare_headers(headers)
         
-        response = await self._make_request_with_retries("DELETE", url, request_headers)
+        response = await self._make_request_with_retries("DELETE", path, request_headers)
         return self._extract_data(response, model_class)
     
     async def patch(
@@ -305,20 +424,7 @@ class HTTPClient:
         model_class: Optional[Type[T]] = None,
     ) -> Any:
         """Make a PATCH request."""
-        url = self._build_url(path)
-        request_headers = await self._prepare_headers(headers)
-        
-        kwargs = {}
-        if json is not None:
-            if isinstance(json, BaseModel):
-                kwargs["json"] = json.model_dump(exclude_none=True)
-            else:
-                kwargs["json"] = json
-        elif data is not None:
-            kwargs["data"] = data
-        
-        response = await self._make_request_with_retries("PATCH", url, request_headers, **kwargs)
-        return self._extract_data(response, model_class)
+        return await self._send("PATCH", path, data, json, headers, model_class)
     
     async def upload_file(
         self,
@@ -331,29 +437,52 @@ class HTTPClient:
         model_class: Optional[Type[T]] = None,
     ) -> Any:
         """Upload a file using multipart/form-data."""
-        url = self._build_url(path)
-        request_headers = await self._prepare_headers(headers)
-        
-        # Remove Content-Type header for multipart uploads
-        if "Content-Type" in request_headers:
-            del request_headers["Content-Type"]
+        # Drop Content-Type for multipart uploads (copy, the prepared headers may be shared)
+        request_headers = {
+            key: value
+            for key, value in (await self._prepare_headers(headers)).items()
+            if key != "Content-Type"
+        }
         
         files = {"file": (filename, file_data, content_type)}
         data = additional_fields or {}
         
         response = await self._make_request_with_retries(
-            "POST", url, request_headers, files=files, data=data
+            "POST", path, request_headers, files=files, data=data
         )
         return self._extract_data(response, model_class)
     
     async def download_file(self, path: str, headers: Optional[Dict[str, str]] = None) -> bytes:
         """Download a file and return the raw bytes."""
-        url = self._build_url(path)
         request_headers = await self._prepare_headers(headers)
         
-        response = await self._make_request_with_retries("GET", url, request_headers)
+        # Buffered downloads are retried as a whole like any other request
+        response = await self._make_request_with_retries("GET", path, request_headers)
+        return response.content
+    
+    async def download_file_iter(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[bytes]:
+        """Download a file, yielding the body in chunks as it arrives.
         
-        if not response.is_success:
-            self._handle_error(response)
+        The body is never held in memory as a whole. Opening the download is
+        retried like any other request; once the first chunk has been yielded
+        a failure is raised to the caller, as the body cannot be replayed.
+        """
+        request_headers = await self._prepare_headers(headers)
+        response = await self._make_request_with_retries(
+            "GET", path, request_headers, stream=True
+        )
         
-        return response.content
\ No newline at end of file
+        try:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"Request timed out after {self.timeout}s") from e
+        except httpx.NetworkError as e:
+            raise NetworkError(f"Network error: {e}") from e
+        finally:
+            await response.aclose()
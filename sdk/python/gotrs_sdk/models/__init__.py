@@ -0,0 +1,135 @@
+"""Data models for the GOTRS API.
+
+Models are grouped into submodules by API area and each submodule is only
+imported when one of its models is first accessed, so a program working
+with tickets does not load the LDAP or webhook models.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from ._base import (
+        BaseGotrsModel,
+        IdentifiedModel,
+        NullableDict,
+        NullableList,
+        RawDict,
+    )
+    from .auth import AuthLoginRequest, AuthLoginResponse
+    from .dashboard import DashboardStats
+    from .ldap import LDAPSyncResult, LDAPUser
+    from .notes import InternalNote, NoteTemplate
+    from .responses import APIResponse, ErrorResponse
+    from .tickets import (
+        Attachment,
+        MessageCreateRequest,
+        Queue,
+        SearchResult,
+        Ticket,
+        TicketCreateRequest,
+        TicketListOptions,
+        TicketListResponse,
+        TicketMessage,
+        TicketUpdateRequest,
+    )
+    from .users import Group, User, UserCreateRequest, UserUpdateRequest
+    from .webhooks import Webhook, WebhookDelivery
+
+# Model name -> submodule it is defined in
+_LAZY: Dict[str, str] = {
+    "BaseGotrsModel": "._base",
+    "IdentifiedModel": "._base",
+    "NullableDict": "._base",
+    "NullableList": "._base",
+    "RawDict": "._base",
+    # Tickets
+    "Ticket": ".tickets",
+    "TicketMessage": ".tickets",
+    "Queue": ".tickets",
+    "Attachment": ".tickets",
+    "SearchResult": ".tickets",
+    "TicketCreateRequest": ".tickets",
+    "TicketUpdateRequest": ".tickets",
+    "TicketListOptions": ".tickets",
+    "TicketListResponse": ".tickets",
+    "MessageCreateRequest": ".tickets",
+    # Users
+    "User": ".users",
+    "Group": ".users",
+    "UserCreateRequest": ".users",
+    "UserUpdateRequest": ".users",
+    # Authentication
+    "AuthLoginRequest": ".auth",
+    "AuthLoginResponse": ".auth",
+    # Dashboard
+    "DashboardStats": ".dashboard",
+    # Notes
+    "InternalNote": ".notes",
+    "NoteTemplate": ".notes",
+    # LDAP
+    "LDAPUser": ".ldap",
+    "LDAPSyncResult": ".ldap",
+    # Webhooks
+    "Webhook": ".webhooks",
+    "WebhookDelivery": ".webhooks",
+    # Response envelopes
+    "APIResponse": ".responses",
+    "ErrorResponse": ".responses",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining name on first access and cache it."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = [
+    "BaseGotrsModel",
+    "IdentifiedModel",
+    "NullableDict",
+    "NullableList",
+    "RawDict",
+    # Tickets
+    "Ticket",
+    "TicketMessage",
+    "Queue",
+    "Attachment",
+    "SearchResult",
+    "TicketCreateRequest",
+    "TicketUpdateRequest",
+    "TicketListOptions",
+    "TicketListResponse",
+    "MessageCreateRequest",
+    # Users
+    "User",
+    "Group",
+    "UserCreateRequest",
+    "UserUpdateRequest",
+    # Authentication
+    "AuthLoginRequest",
+    "AuthLoginResponse",
+    # Dashboard
+    "DashboardStats",
+    # Notes
+    "InternalNote",
+    "NoteTemplate",
+    # LDAP
+    "LDAPUser",
+    "LDAPSyncResult",
+    # Webhooks
+    "Webhook",
+    "WebhookDelivery",
+    # Response envelopes
+    "APIResponse",
+    "ErrorResponse",
+]
@@ -0,0 +1,87 @@
+"""Shared base model and field types for the GOTRS API models."""
+
+import copy
+from typing import Any, Dict, List, Tuple, TypeVar
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict, PlainValidator, WithJsonSchema
+from typing_extensions import Annotated
+
+T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+def _list_if_none(value: Any) -> Any:
+    return [] if value is None else value
+
+
+def _dict_if_none(value: Any) -> Any:
+    return {} if value is None else value
+
+
+# Collections the server encodes as null when empty (Go nil slices and maps);
+# null is accepted and stored as an empty list or dict
+NullableList = Annotated[List[T], BeforeValidator(_list_if_none)]
+NullableDict = Annotated[Dict[K, V], BeforeValidator(_dict_if_none)]
+
+
+def _raw_dict(value: Any) -> Dict[str, Any]:
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        raise ValueError("Input should be a valid dictionary")
+    return value
+
+
+# Free-form JSON object stored as received, without walking its contents.
+# PlainValidator hides the dict type from the JSON schema, so restore it.
+RawDict = Annotated[
+    Dict[str, Any],
+    PlainValidator(_raw_dict),
+    WithJsonSchema({"type": "object", "additionalProperties": True}),
+]
+
+# JSON schemas per (model class, model_json_schema arguments), built on first use
+_JSON_SCHEMAS: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+
+class BaseGotrsModel(BaseModel):
+    """Base model for all GOTRS API models."""
+    
+    model_config = ConfigDict(
+        # Fields added by newer servers are dropped rather than rejected
+        extra="ignore",
+        # Core schemas are built on first validation rather than at import,
+        # so importing the SDK only pays for the models a program uses.
+        # Forward references ("User", "TicketMessage", ...) are resolved
+        # against the defining submodule at that point.
+        defer_build=True,
+    )
+    
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Generate the model's JSON schema, reusing it on repeated calls.
+        
+        Callers get their own copy, so mutating the result is safe.
+        """
+        key = (cls, args, tuple(sorted(kwargs.items())))
+        schema = _JSON_SCHEMAS.get(key)
+        if schema is None:
+            schema = super().model_json_schema(*args, **kwargs)
+            _JSON_SCHEMAS[key] = schema
+        return copy.deepcopy(schema)
+
+
+class IdentifiedModel(BaseGotrsModel):
+    """Base for models with a server-assigned integer ``id``.
+    
+    Instances hash by type and id, so they can be deduplicated with sets
+    and used as dict keys. Equality still compares every field, which keeps
+    the hash consistent: equal instances always share an id. Do not change
+    ``id`` on an instance that is stored in a set or used as a key.
+    """
+    
+    id: int
+    
+    def __hash__(self) -> int:
+        return hash((type(self), self.id))
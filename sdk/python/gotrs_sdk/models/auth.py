@@ -0,0 +1,26 @@
+"""Authentication request and response models."""
+
+from datetime import datetime
+
+from pydantic import ConfigDict
+
+from ._base import BaseGotrsModel
+from .users import User
+
+
+class AuthLoginRequest(BaseGotrsModel):
+    """Request model for authentication."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    email: str
+    password: str
+
+
+class AuthLoginResponse(BaseGotrsModel):
+    """Response model for authentication."""
+    
+    token: str
+    refresh_token: str
+    expires_at: datetime
+    user: User
@@ -0,0 +1,20 @@
+"""Dashboard statistics models."""
+
+from typing import Dict
+
+from ._base import BaseGotrsModel
+
+
+class DashboardStats(BaseGotrsModel):
+    """Represents dashboard statistics."""
+    
+    total_tickets: int
+    open_tickets: int
+    closed_tickets: int
+    pending_tickets: int
+    overdue_tickets: int
+    unassigned_tickets: int
+    my_tickets: int
+    tickets_by_status: Dict[str, int]
+    tickets_by_priority: Dict[str, int]
+    tickets_by_queue: Dict[str, int]
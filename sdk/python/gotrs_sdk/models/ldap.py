@@ -0,0 +1,44 @@
+"""LDAP directory models."""
+
+from datetime import datetime
+from typing import Dict, List
+
+from ._base import BaseGotrsModel
+
+
+class LDAPUser(BaseGotrsModel):
+    """Represents a user from LDAP."""
+    
+    dn: str
+    username: str
+    email: str
+    first_name: str
+    last_name: str
+    display_name: str
+    phone: str
+    department: str
+    title: str
+    manager: str
+    groups: List[str]
+    attributes: Dict[str, str]
+    object_guid: str
+    object_sid: str
+    last_login: datetime
+    is_active: bool
+
+
+class LDAPSyncResult(BaseGotrsModel):
+    """Represents the result of an LDAP sync operation."""
+    
+    users_found: int
+    users_created: int
+    users_updated: int
+    users_disabled: int
+    groups_found: int
+    groups_created: int
+    groups_updated: int
+    errors: List[str]
+    start_time: datetime
+    end_time: datetime
+    duration: str
+    dry_run: bool
@@ -0,0 +1,39 @@
+"""Internal note models."""
+
+from datetime import datetime
+from typing import List
+
+from ._base import BaseGotrsModel
+
+
+class InternalNote(BaseGotrsModel):
+    """Represents an internal note."""
+    
+    id: int
+    ticket_id: int
+    content: str
+    category: str
+    is_important: bool
+    is_pinned: bool
+    tags: List[str]
+    author_id: int
+    author_name: str
+    author_email: str
+    created_at: datetime
+    updated_at: datetime
+    edited_at: datetime
+    edited_by: int
+
+
+class NoteTemplate(BaseGotrsModel):
+    """Represents a note template."""
+    
+    id: int
+    name: str
+    content: str
+    category: str
+    tags: List[str]
+    is_important: bool
+    created_by: int
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,22 @@
+"""Generic API response envelopes."""
+
+from typing import Any, Optional
+
+from ._base import BaseGotrsModel
+
+
+class APIResponse(BaseGotrsModel):
+    """Standard API response wrapper."""
+    
+    success: bool
+    data: Optional[Any] = None
+    error: Optional[str] = None
+    message: Optional[str] = None
+
+
+class ErrorResponse(BaseGotrsModel):
+    """API error response."""
+    
+    error: str
+    message: str
+    code: int
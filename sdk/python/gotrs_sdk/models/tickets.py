@@ -0,0 +1,156 @@
+"""Ticket, message, queue and attachment models."""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field, ConfigDict
+
+from ._base import BaseGotrsModel, IdentifiedModel, NullableList, RawDict
+from .users import User  # resolves the "User" forward references
+
+
+class Ticket(IdentifiedModel):
+    """Represents a support ticket."""
+    
+    id: int
+    ticket_number: str
+    title: str
+    description: str
+    status: str
+    priority: str
+    type: str
+    queue_id: int
+    customer_id: int
+    assigned_to: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+    closed_at: Optional[datetime] = None
+    tags: NullableList[str] = Field(default_factory=list)
+    custom_fields: RawDict = Field(default_factory=dict)
+    customer: Optional["User"] = None
+    assigned_user: Optional["User"] = None
+    queue: Optional["Queue"] = None
+    messages: NullableList["TicketMessage"] = Field(default_factory=list)
+    attachments: NullableList["Attachment"] = Field(default_factory=list)
+
+
+class TicketMessage(BaseGotrsModel):
+    """Represents a message in a ticket."""
+    
+    id: int
+    ticket_id: int
+    content: str
+    message_type: str
+    is_internal: bool
+    author_id: int
+    created_at: datetime
+    updated_at: datetime
+    author: Optional["User"] = None
+    attachments: NullableList["Attachment"] = Field(default_factory=list)
+    custom_fields: RawDict = Field(default_factory=dict)
+
+
+class Queue(IdentifiedModel):
+    """Represents a ticket queue."""
+    
+    id: int
+    name: str
+    description: str
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class Attachment(IdentifiedModel):
+    """Represents a file attachment."""
+    
+    id: int
+    filename: str
+    content_type: str
+    size: int
+    ticket_id: int
+    message_id: Optional[int] = None
+    uploaded_by: int
+    created_at: datetime
+
+
+class SearchResult(BaseGotrsModel):
+    """Represents search results."""
+    
+    total_count: int
+    page: int
+    page_size: int
+    tickets: List[Ticket]
+
+
+class TicketCreateRequest(BaseGotrsModel):
+    """Request model for creating a ticket."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    title: str
+    description: str
+    priority: Optional[str] = "normal"
+    type: Optional[str] = "incident"
+    queue_id: Optional[int] = None
+    customer_id: Optional[int] = None
+    assigned_to: Optional[int] = None
+    tags: Optional[List[str]] = None
+    custom_fields: Optional[RawDict] = None
+
+
+class TicketUpdateRequest(BaseGotrsModel):
+    """Request model for updating a ticket."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    type: Optional[str] = None
+    queue_id: Optional[int] = None
+    assigned_to: Optional[int] = None
+    tags: Optional[List[str]] = None
+    custom_fields: Optional[RawDict] = None
+
+
+class TicketListOptions(BaseGotrsModel):
+    """Options for listing tickets."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    page: Optional[int] = 1
+    page_size: Optional[int] = 50
+    status: Optional[List[str]] = None
+    priority: Optional[List[str]] = None
+    queue_id: Optional[List[int]] = None
+    assigned_to: Optional[int] = None
+    customer_id: Optional[int] = None
+    search: Optional[str] = None
+    tags: Optional[List[str]] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    sort_by: Optional[str] = "created_at"
+    sort_order: Optional[str] = "desc"
+
+
+class TicketListResponse(BaseGotrsModel):
+    """Response model for listing tickets."""
+    
+    tickets: List[Ticket]
+    total_count: int
+    page: int
+    page_size: int
+    total_pages: int
+
+
+class MessageCreateRequest(BaseGotrsModel):
+    """Request model for creating a message."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    content: str
+    message_type: Optional[str] = "note"
+    is_internal: Optional[bool] = False
+    custom_fields: Optional[RawDict] = None
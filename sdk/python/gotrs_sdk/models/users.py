@@ -0,0 +1,63 @@
+"""User and group models."""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import Field, ConfigDict
+
+from ._base import BaseGotrsModel, IdentifiedModel
+
+
+class User(IdentifiedModel):
+    """Represents a user in the system."""
+    
+    id: int
+    email: str
+    first_name: str
+    last_name: str
+    login: str
+    title: str
+    role: str
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+    last_login_at: datetime
+
+
+class Group(IdentifiedModel):
+    """Represents a user group."""
+    
+    id: int
+    name: str
+    description: str
+    type: str
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class UserCreateRequest(BaseGotrsModel):
+    """Request model for creating a user."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    email: str
+    first_name: str
+    last_name: str
+    login: str
+    title: Optional[str] = ""
+    role: Optional[str] = "user"
+    password: str = Field(min_length=8)
+
+
+class UserUpdateRequest(BaseGotrsModel):
+    """Request model for updating a user."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    email: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    title: Optional[str] = None
+    role: Optional[str] = None
+    is_active: Optional[bool] = None
@@ -0,0 +1,39 @@
+"""Webhook models."""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import Field
+
+from ._base import BaseGotrsModel, IdentifiedModel, NullableDict
+
+
+class Webhook(IdentifiedModel):
+    """Represents a webhook configuration."""
+    
+    id: int
+    name: str
+    url: str
+    events: List[str]
+    secret: Optional[str] = None
+    is_active: bool
+    retry_count: int
+    timeout: int
+    headers: NullableDict[str, str] = Field(default_factory=dict)
+    created_at: datetime
+    updated_at: datetime
+    last_fired_at: Optional[datetime] = None
+
+
+class WebhookDelivery(BaseGotrsModel):
+    """Represents a webhook delivery attempt."""
+    
+    id: int
+    webhook_id: int
+    event: str
+    payload: str
+    status_code: int
+    response: str
+    success: bool
+    attempt: int
+    delivered_at: datetime